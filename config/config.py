@@ -1,10 +1,26 @@
 import os
-import json
+import functools
 from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+from .settings import load_json_file
+
+@functools.lru_cache(maxsize=1)
+def _load_environment_once() -> bool:
+    """Load environment variables from .env file, once per process"""
+    env_path = Path(".env")
+    if env_path.exists():
+        load_dotenv(env_path)
+        return True
+    return False
+
 class TradingConfig:
+    __slots__ = (
+        'config_path', 'cdp_key_path', 'config', 'cdp_credentials',
+        '_trading_params', '_exchange_settings', '_websocket'
+    )
+
     def __init__(self, 
                  config_path: str = "config/trading_config.json",
                  cdp_key_path: str = "config/cdp_api_key.json"):
@@ -19,21 +35,22 @@ class TradingConfig:
         
     def _load_environment(self):
         """Load environment variables from .env file"""
-        env_path = Path(".env")
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_environment_once()
             
     def _load_config(self):
         """Load configuration from JSON file"""
         if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = load_json_file(self.config_path)
+        # Sections are resolved once here; the properties below just return them
+        self._trading_params = self.config.get('trading_params', {})
+        self._exchange_settings = self.config.get('exchange_settings', {})
+        self._websocket = self.config.get('websocket', {})
 
     def _load_cdp_credentials(self):
         """Load Coinbase CDP API credentials from JSON file"""
+        # load_json_file re-reads the file only when its mtime or size changes
         if self.cdp_key_path.exists():
-            with open(self.cdp_key_path, 'r') as f:
-                self.cdp_credentials = json.load(f)
+            self.cdp_credentials = load_json_file(self.cdp_key_path)
         else:
             print(f"Warning: CDP API key file not found at {self.cdp_key_path}")
                 
@@ -45,17 +62,17 @@ class TradingConfig:
     @property
     def trading_params(self) -> Dict[str, Any]:
         """Get trading parameters"""
-        return self.config.get('trading_params', {})
+        return self._trading_params
     
     @property
     def exchange_settings(self) -> Dict[str, Any]:
         """Get exchange settings"""
-        return self.config.get('exchange_settings', {})
+        return self._exchange_settings
     
     @property
     def websocket(self) -> Dict[str, Any]:
         """Get websocket settings"""
-        return self.config.get('websocket', {})
+        return self._websocket
 
     def validate(self) -> bool:
         """Validate configuration"""
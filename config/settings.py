@@ -7,11 +7,12 @@ handling of sensitive data.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
-import json
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import os
 from decimal import Decimal
 import logging
+from crypto_j_trader.src.trading.json_utils import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,8 @@ class ConfigurationError(Exception):
 class BaseConfig:
     """Base configuration class with common validation logic."""
     
+    __slots__ = ('config_path', 'config', '_risk_limits')
+    
     def __init__(self, config_path: Path):
         """
         Initialize configuration from file.
@@ -30,14 +33,14 @@ class BaseConfig:
             config_path: Path to configuration file
         """
         self.config_path = Path(config_path)
+        self._risk_limits: Optional[Mapping[str, Decimal]] = None
         self.config = self._load_config()
         self._validate_config()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load and parse configuration file."""
         try:
-            with open(self.config_path) as f:
-                return json.load(f)
+            return load_json_file(self.config_path)
         except Exception as e:
             raise ConfigurationError(f"Failed to load config from {self.config_path}: {str(e)}")
     
@@ -57,21 +60,29 @@ class BaseConfig:
         """Load API credentials from separate secure file."""
         try:
             creds_path = self.config_path.parent / "cdp_api_key.json"
-            with open(creds_path) as f:
-                creds = json.load(f)
-                required = {"api_key", "api_secret"}
-                if not all(k in creds for k in required):
-                    raise ConfigurationError("Missing required API credentials")
-                return creds
+            creds = load_json_file(creds_path)
+            required = {"api_key", "api_secret"}
+            if not all(k in creds for k in required):
+                raise ConfigurationError("Missing required API credentials")
+            return creds
         except Exception as e:
             raise ConfigurationError(f"Failed to load API credentials: {str(e)}")
     
+    @property
+    def risk_limits(self) -> Mapping[str, Decimal]:
+        """Read-only risk management limits with proper decimal conversion, built once."""
+        if self._risk_limits is None:
+            limits = self.config.get("risk_management", {})
+            # bool is an int subclass; it must not slip through as Decimal(0/1)
+            self._risk_limits = MappingProxyType({
+                k: Decimal(v) if type(v) is int else Decimal(str(v))
+                for k, v in limits.items()
+            })
+        return self._risk_limits
+
     def get_risk_limits(self) -> Dict[str, Decimal]:
         """Get risk management limits with proper decimal conversion."""
-        limits = self.config.get("risk_management", {})
-        return {
-            k: Decimal(str(v)) for k, v in limits.items()
-        }
+        return dict(self.risk_limits)
     
     def get_trading_pairs(self) -> list:
         """Get configured trading pairs."""
@@ -84,6 +95,8 @@ class BaseConfig:
 class DevelopmentConfig(BaseConfig):
     """Development environment configuration."""
     
+    __slots__ = ()
+    
     def _validate_config(self) -> None:
         """Additional validation for development environment."""
         super()._validate_config()
@@ -94,6 +107,8 @@ class DevelopmentConfig(BaseConfig):
 class ProductionConfig(BaseConfig):
     """Production environment configuration with stricter validation."""
     
+    __slots__ = ()
+    
     def _validate_config(self) -> None:
         """Additional validation for production environment."""
         super()._validate_config()
@@ -113,12 +128,23 @@ class ProductionConfig(BaseConfig):
 class TestConfig(BaseConfig):
     """Test environment configuration."""
     
+    __slots__ = ()
+    
     def _validate_config(self) -> None:
         """Validation for test environment."""
         # Basic validation is sufficient for tests
         if not self.is_paper_trading():
             raise ConfigurationError("Tests must use paper trading")
 
+_CONFIG_DIR = Path("config")
+
+# Environment name -> (config class, file name under _CONFIG_DIR)
+_CONFIG_MAP: Mapping[str, tuple] = MappingProxyType({
+    "development": (DevelopmentConfig, "config.json"),
+    "production": (ProductionConfig, "production.json"),
+    "test": (TestConfig, "test_config.json")
+})
+
 def load_config(environment: Optional[str] = None) -> BaseConfig:
     """
     Factory function to load appropriate configuration based on environment.
@@ -132,19 +158,11 @@ def load_config(environment: Optional[str] = None) -> BaseConfig:
     if environment is None:
         environment = os.getenv("ENVIRONMENT", "development").lower()
     
-    config_dir = Path("config")
-    
-    config_map = {
-        "development": (DevelopmentConfig, "config.json"),
-        "production": (ProductionConfig, "production.json"),
-        "test": (TestConfig, "test_config.json")
-    }
-    
-    if environment not in config_map:
-        raise ConfigurationError(f"Invalid environment: {environment}")
-    
-    ConfigClass, filename = config_map[environment]
-    config_path = config_dir / filename
+    try:
+        ConfigClass, filename = _CONFIG_MAP[environment]
+    except KeyError:
+        raise ConfigurationError(f"Invalid environment: {environment}") from None
+    config_path = _CONFIG_DIR / filename
     
     if not config_path.exists():
         raise ConfigurationError(f"Configuration file not found: {config_path}")
@@ -3,25 +3,91 @@ Minimal viable trading bot main entry point.
 Focuses on basic trading functionality with essential safety features.
 """
 
+from __future__ import annotations
+
 import os
+import sys
+import queue
+import atexit
+import asyncio
 import logging
-import json
-from typing import Dict
-from coinbase.rest import RESTClient
+import functools
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Dict
 from trading.trading_core import TradingCore
 from trading.risk_management import RiskManager
+from trading.json_utils import load_json_file
+
+if TYPE_CHECKING:
+    from coinbase.rest import RESTClient
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('trading.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger('main')
 
+def setup_logging() -> None:
+    """
+    Send log records through a queue to a background listener thread.
+
+    Callers only enqueue records; the listener does the file and console
+    I/O. Like logging.basicConfig, this does nothing if the root logger
+    already has handlers.
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = (logging.FileHandler('trading.log'), logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)  # drain queued records at exit
+
+# Seconds before an exchange request is abandoned, so a stalled
+# connectivity probe fails fast instead of hanging startup
+CLIENT_TIMEOUT = 10
+
+@functools.lru_cache(maxsize=4)
+def _make_client(api_key: str, api_secret: str, probe: bool) -> RESTClient:
+    """
+    Build (and optionally verify) an exchange client, shared per credential pair.
+
+    Args:
+        api_key: Coinbase API key
+        api_secret: Coinbase API secret
+        probe: Verify connectivity with a get_accounts() round-trip
+    """
+    # Imported here so the coinbase SDK only loads when a client is built
+    from coinbase.rest import RESTClient
+
+    client = RESTClient(
+        api_key=api_key,
+        api_secret=api_secret,
+        timeout=CLIENT_TIMEOUT
+    )
+
+    if probe:
+        # Test API connection
+        response = client.get_accounts()
+        if not hasattr(response, 'accounts'):
+            raise ValueError("Invalid API response")
+
+    return client
+
+def _install_uvloop() -> None:
+    """Prefer the libuv event loop for the async trading components when available."""
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 class TradingBot:
     def __init__(self, config_path: str = './config/config.json'):
         """Initialize minimal trading bot"""
@@ -35,8 +101,7 @@ class TradingBot:
     def _load_config(self, config_path: str) -> Dict:
         """Load and validate configuration"""
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = load_json_file(config_path)
 
             required_fields = ['trading_pair', 'risk']
             for field in required_fields:
@@ -57,15 +122,8 @@ class TradingBot:
             if not api_key or not api_secret:
                 raise ValueError("Missing API key or secret in environment variables")
 
-            client = RESTClient(
-                api_key=api_key,
-                api_secret=api_secret
-            )
-
-            # Test API connection
-            response = client.get_accounts()
-            if not hasattr(response, 'accounts'):
-                raise ValueError("Invalid API response")
+            probe = os.environ.get("TESTING", "").lower() != "true"
+            client = _make_client(api_key, api_secret, probe)
 
             logger.info("Exchange client initialized successfully")
             return client
@@ -93,6 +151,9 @@ class TradingBot:
             raise
 
 if __name__ == "__main__":
+    # Configure process-wide logging and loop policy only when run as the entry point
+    setup_logging()
+    _install_uvloop()
     try:
         bot = TradingBot()
         bot.run()
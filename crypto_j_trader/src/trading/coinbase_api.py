@@ -7,11 +7,17 @@ for order execution, market data, and account management.
 import hmac
 import hashlib
 import time
-import json
-from typing import Dict, Optional, Any, List
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Optional, Any, List
 from dataclasses import dataclass
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from typing_extensions import TypedDict
+from .json_utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
 
 class ApiCredentials(TypedDict):
     api_key: str
@@ -26,6 +32,35 @@ class OrderRequest:
     price: Optional[str] = None  # required for limit orders
     stop_price: Optional[str] = None  # required for stop orders
 
+def _add_limit_fields(order: OrderRequest, config: Dict[str, str]) -> None:
+    """Add price for limit orders"""
+    if order.price:
+        config["limit_price"] = order.price
+
+def _add_stop_fields(order: OrderRequest, config: Dict[str, str]) -> None:
+    """Add stop price for stop orders"""
+    if order.stop_price:
+        config["stop_price"] = order.stop_price
+
+# Order type -> filler for its type-specific order_configuration fields
+_ORDER_FIELDS = {
+    "limit": _add_limit_fields,
+    "stop": _add_stop_fields,
+    "stop_limit": _add_stop_fields
+}
+
+def _order_payload(order: OrderRequest) -> Dict[str, Any]:
+    """Build the create-order request body shared by the sync and async clients"""
+    config = {"quote_size": order.size}
+    add_fields = _ORDER_FIELDS.get(order.order_type)
+    if add_fields is not None:
+        add_fields(order, config)
+    return {
+        "product_id": order.product_id,
+        "side": order.side,
+        "order_configuration": {order.order_type: config}
+    }
+
 class CoinbaseApiError(Exception):
     """Custom exception for Coinbase API errors"""
     def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[Dict] = None):
@@ -34,21 +69,31 @@ class CoinbaseApiError(Exception):
         self.response = response
         super().__init__(self.message)
 
-class CoinbaseAdvancedClient:
-    """
-    Coinbase Advanced Trade API Client implementing v3 endpoints
-    Documentation: https://docs.cdp.coinbase.com/advanced-trade/docs/welcome
-    """
+class _CoinbaseClientBase:
+    """Credentials and request signing shared by the sync and async clients"""
     BASE_URL = "https://api.coinbase.com/api/v3/brokerage"
+    # Keep-alive connections held open to the API host
+    POOL_SIZE = 50
 
     def __init__(self, credentials: ApiCredentials):
+        """Store credentials and prepare the keyed HMAC reused for every signature"""
         self.api_key = credentials['api_key']
         self.api_secret = credentials['api_secret']
-        self.session = requests.Session()
+        self._hmac_template = hmac.new(self.api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        # Static header entries; each request copies this and fills in the signature
+        self._base_headers = {
+            "CB-ACCESS-KEY": self.api_key,
+            "Content-Type": "application/json"
+        }
+        self._timestamp_cache = (0, "0")
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO 8601 format"""
-        return str(int(time.time()))
+        now = int(time.time())
+        if now != self._timestamp_cache[0]:
+            # Requests within the same second share one string
+            self._timestamp_cache = (now, str(now))
+        return self._timestamp_cache[1]
 
     def _sign_message(self, timestamp: str, method: str, request_path: str, body: str = "") -> str:
         """
@@ -60,23 +105,29 @@ class CoinbaseAdvancedClient:
             request_path: API endpoint path
             body: Request body for POST requests
         """
-        message = f"{timestamp}{method}{request_path}{body}"
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        )
+        signature = self._hmac_template.copy()
+        signature.update(f"{timestamp}{method}{request_path}{body}".encode('utf-8'))
         return signature.hexdigest()
 
     def _generate_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
         """Generate required headers for API request"""
         timestamp = self._get_timestamp()
-        return {
-            "CB-ACCESS-KEY": self.api_key,
-            "CB-ACCESS-SIGN": self._sign_message(timestamp, method, path, body),
-            "CB-ACCESS-TIMESTAMP": timestamp,
-            "Content-Type": "application/json"
-        }
+        # Copied, not shared: concurrent async requests each keep their own headers
+        headers = self._base_headers.copy()
+        headers["CB-ACCESS-SIGN"] = self._sign_message(timestamp, method, path, body)
+        headers["CB-ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+class CoinbaseAdvancedClient(_CoinbaseClientBase):
+    """
+    Coinbase Advanced Trade API Client implementing v3 endpoints
+    Documentation: https://docs.cdp.coinbase.com/advanced-trade/docs/welcome
+    """
+
+    def __init__(self, credentials: ApiCredentials):
+        super().__init__(credentials)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE))
 
     def _request(self, method: str, path: str, data: Optional[Dict] = None) -> Dict:
         """
@@ -94,13 +145,21 @@ class CoinbaseAdvancedClient:
             CoinbaseApiError: If API request fails
         """
         url = f"{self.BASE_URL}{path}"
-        body = json.dumps(data) if data else ""
+        body = json_dumps(data).decode('utf-8') if data else ""
         headers = self._generate_headers(method, path, body)
 
         try:
-            response = self.session.request(method, url, headers=headers, json=data)
+            # Send the exact bytes that were signed
+            response = self.session.request(method, url, headers=headers, data=body or None)
             response.raise_for_status()
-            return response.json()
+            # Parse the raw bytes; response.json() would decode to str first
+            try:
+                return json_loads(response.content)
+            except ValueError as e:
+                raise CoinbaseApiError(
+                    f"Invalid JSON in API response: {str(e)}",
+                    status_code=response.status_code
+                )
         except requests.exceptions.RequestException as e:
             status_code = getattr(e.response, 'status_code', None)
             error_response = None
@@ -124,26 +183,7 @@ class CoinbaseAdvancedClient:
         Returns:
             Order creation response
         """
-        endpoint = "/orders"
-        payload = {
-            "product_id": order.product_id,
-            "side": order.side,
-            "order_configuration": {
-                order.order_type: {
-                    "quote_size": order.size
-                }
-            }
-        }
-
-        # Add price for limit orders
-        if order.order_type == "limit" and order.price:
-            payload["order_configuration"]["limit"]["limit_price"] = order.price
-
-        # Add stop price for stop orders
-        if order.order_type in ["stop", "stop_limit"] and order.stop_price:
-            payload["order_configuration"][order.order_type]["stop_price"] = order.stop_price
-
-        return self._request("POST", endpoint, payload)
+        return self._request("POST", "/orders", _order_payload(order))
 
     def get_order(self, order_id: str) -> Dict[str, Any]:
         """Get order details by ID"""
@@ -191,4 +231,170 @@ class CoinbaseAdvancedClient:
     def get_account(self) -> Dict[str, Any]:
         """Get account information"""
         endpoint = "/accounts"
-        return self._request("GET", endpoint)
\ No newline at end of file
+        return self._request("GET", endpoint)
+
+class AsyncCoinbaseAdvancedClient(_CoinbaseClientBase):
+    """
+    Non-blocking counterpart of CoinbaseAdvancedClient for use inside the event loop.
+
+    It offers the same endpoint methods (create_order, get_ticker, ...) as
+    coroutines, so several requests can be in flight at once:
+
+        async with AsyncCoinbaseAdvancedClient(credentials) as client:
+            tickers = await client.get_tickers(["BTC-USD", "ETH-USD"])
+    """
+    # Seconds before a request is abandoned
+    REQUEST_TIMEOUT = 10
+    WS_URL = "wss://advanced-trade-ws.coinbase.com"
+    # Reconnect backoff for stream(), in seconds
+    RECONNECT_DELAY = 0.05
+    MAX_RECONNECT_DELAY = 30
+
+    def __init__(self, credentials: ApiCredentials):
+        super().__init__(credentials)
+        # Created on first request so it binds to the running event loop
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it if needed"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.POOL_SIZE, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+            )
+        return self.session
+
+    async def _request(self, method: str, path: str, data: Optional[Dict] = None) -> Dict:
+        """
+        Make authenticated request to Coinbase API without blocking the event loop
+        
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            data: Request payload for POST requests
+        
+        Returns:
+            API response as dictionary
+        
+        Raises:
+            CoinbaseApiError: If API request fails
+        """
+        url = f"{self.BASE_URL}{path}"
+        body = json_dumps(data).decode('utf-8') if data else ""
+        headers = self._generate_headers(method, path, body)
+
+        try:
+            async with self._get_session().request(
+                method, url, headers=headers, data=body or None
+            ) as response:
+                if response.status >= 400:
+                    error_response = None
+                    try:
+                        error_response = json_loads(await response.read())
+                    except Exception:
+                        pass
+                    raise CoinbaseApiError(
+                        f"API request failed: {response.status} {response.reason}",
+                        status_code=response.status,
+                        response=error_response
+                    )
+                try:
+                    return json_loads(await response.read())
+                except ValueError as e:
+                    raise CoinbaseApiError(
+                        f"Invalid JSON in API response: {str(e)}",
+                        status_code=response.status
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise CoinbaseApiError(f"API request failed: {str(e)}")
+
+    async def create_order(self, order: OrderRequest) -> Dict[str, Any]:
+        """Create a new order"""
+        return await self._request("POST", "/orders", _order_payload(order))
+
+    async def get_order(self, order_id: str) -> Dict[str, Any]:
+        """Get order details by ID"""
+        return await self._request("GET", f"/orders/{order_id}")
+
+    async def list_orders(self, product_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List orders with optional product filter"""
+        endpoint = "/orders"
+        if product_id:
+            endpoint += f"?product_id={product_id}"
+        return await self._request("GET", endpoint)
+
+    async def cancel_order(self, order_id: str) -> Dict[str, Any]:
+        """Cancel an order by ID"""
+        return await self._request("DELETE", f"/orders/{order_id}")
+
+    async def get_product(self, product_id: str) -> Dict[str, Any]:
+        """Get product details"""
+        return await self._request("GET", f"/products/{product_id}")
+
+    async def get_product_book(self, product_id: str, level: int = 1) -> Dict[str, Any]:
+        """Get product order book at level 1, 2 or 3"""
+        return await self._request("GET", f"/products/{product_id}/book?level={level}")
+
+    async def get_ticker(self, product_id: str) -> Dict[str, Any]:
+        """Get current ticker for a product"""
+        return await self._request("GET", f"/products/{product_id}/ticker")
+
+    async def get_trades(self, product_id: str) -> List[Dict[str, Any]]:
+        """Get recent trades for a product"""
+        return await self._request("GET", f"/products/{product_id}/trades")
+
+    async def get_account(self) -> Dict[str, Any]:
+        """Get account information"""
+        return await self._request("GET", "/accounts")
+
+    async def get_tickers(self, product_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get current tickers for several products concurrently"""
+        return await asyncio.gather(*(self.get_ticker(p) for p in product_ids))
+
+    async def stream(self, product_ids: List[str], channel: str = "ticker") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield push messages from the Advanced Trade WebSocket feed
+        
+        The receive loop awaits each frame, so an idle feed costs no CPU.
+        Dropped connections are re-established with exponential backoff.
+        
+        Args:
+            product_ids: Products to subscribe to
+            channel: Feed channel name
+        """
+        subscribe = json_dumps({"type": "subscribe", "product_ids": product_ids, "channel": channel}).decode('utf-8')
+        delay = self.RECONNECT_DELAY
+        while True:
+            try:
+                async with self._get_session().ws_connect(self.WS_URL, heartbeat=30) as ws:
+                    await ws.send_str(subscribe)
+                    delay = self.RECONNECT_DELAY
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            try:
+                                message = json_loads(msg.data)
+                            except ValueError as e:
+                                # One undecodable frame must not end the feed
+                                logger.warning(f"Skipping undecodable WebSocket frame: {e}")
+                                continue
+                            yield message
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            logger.warning(f"WebSocket feed error: {ws.exception()}")
+                            break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(f"WebSocket feed connection failed: {e!r}")
+            logger.info(f"Reconnecting WebSocket feed in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RECONNECT_DELAY)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self) -> "AsyncCoinbaseAdvancedClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
@@ -1,15 +1,178 @@
 """
 Emergency Manager for handling system emergencies and risk events
 """
-import json
+import os
+import math
+import mmap
+import time
+import atexit
+import hashlib
+import weakref
 import asyncio
+import functools
 import logging
-from typing import Dict, Optional, List, Union
+import threading
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Sequence, Tuple, Union
 from decimal import Decimal
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from .json_utils import json_dumps, json_loads
+
+# State files larger than this are parsed straight from a read-only mapping
+_MMAP_THRESHOLD = 64 * 1024
+
+def _read_state_file(path: Path) -> Tuple[Dict, str]:
+    """Parse a state file and hash its raw bytes, without copying large files."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            raw = f.read()
+            return json_loads(raw), hashlib.sha256(raw).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as raw:
+            return json_loads(raw), hashlib.sha256(raw).hexdigest()
+
+# (epoch milliseconds, ISO string) of the last timestamp handed out
+_iso_cache = (0, '')
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp (naive, like utcnow), reused within the same millisecond."""
+    global _iso_cache
+    ms = int(time.time() * 1000)
+    cached_ms, cached_iso = _iso_cache
+    if ms == cached_ms:
+        return cached_iso
+    iso = datetime.fromtimestamp(ms / 1000, timezone.utc).replace(tzinfo=None).isoformat()
+    _iso_cache = (ms, iso)
+    return iso
+
+_ZERO = Decimal('0')
+_INF = Decimal('inf')
+
+def _as_decimal(value) -> Decimal:
+    """Return Decimal values as-is; convert other numbers via str to keep their printed digits."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+def _parse_limits(config: Dict) -> Tuple[Dict[str, Decimal], Dict[str, Decimal], Dict[str, Decimal]]:
+    """Convert the max_positions, risk_limits and emergency_thresholds sections to Decimal."""
+    return tuple(
+        {k: Decimal(str(v)) for k, v in config.get(section, {}).items()}
+        for section in ('max_positions', 'risk_limits', 'emergency_thresholds')
+    )
+
+@functools.lru_cache(maxsize=32)
+def _load_limits_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Mapping[str, Decimal], ...]:
+    """
+    Parse an emergency config file once per (path, mtime, size) key.
+
+    The converted sections are shared between managers, so they are wrapped
+    read-only; each manager takes its own copies.
+    """
+    with open(path_str, 'rb') as f:
+        config = json_loads(f.read())
+    return tuple(MappingProxyType(limits) for limits in _parse_limits(config))
+
+# Relative gap below which a float limit comparison is re-checked in Decimal
+_TIE_EPSILON = 1e-9
+
+def _exceeds(value: float, limit, exact_value) -> bool:
+    """
+    Check value > limit in float, deferring to Decimal only near the boundary.
+
+    Args:
+        value: Float amount being checked
+        limit: Limit as Decimal, float or int
+        exact_value: Callable returning the same amount as a Decimal
+    """
+    limit_f = float(limit)
+    if not math.isfinite(limit_f):
+        return value > limit_f  # no tie is possible with an unbounded limit
+    if abs(value - limit_f) > _TIE_EPSILON * max(1.0, abs(limit_f)):
+        return value > limit_f
+    return exact_value() > _as_decimal(limit)
+
+def _near_limit(values: np.ndarray, limits: np.ndarray) -> np.ndarray:
+    """Mask of values too close to their limit to decide in float."""
+    # Infinite limits (no threshold configured) can never be a tie
+    with np.errstate(invalid='ignore'):
+        return np.isfinite(limits) & (
+            np.abs(values - limits) <= _TIE_EPSILON * np.maximum(1.0, np.abs(limits))
+        )
+
+# Synchronous data writes where supported, saving a separate fsync per save
+_O_DSYNC = getattr(os, 'O_DSYNC', 0)
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write every byte of data; a single os.write may write only part of it."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        if not written:
+            raise OSError(f"Short write to file descriptor {fd}")
+        view = view[written:]
+
+# Managers with unflushed state, written out one last time at interpreter exit
+_pending_managers = weakref.WeakSet()
+
+@atexit.register
+def _flush_pending_managers() -> None:
+    for manager in list(_pending_managers):
+        manager._flush()
+
+class _ValidationBatcher:
+    """
+    Coalesce position validations submitted in the same event-loop iteration.
+
+    All requests queued before the loop next runs its callbacks are decided
+    together by one validate_new_positions_batch call.
+    """
+    __slots__ = ('_manager', '_pending', '_scheduled')
+
+    def __init__(self, manager: 'EmergencyManager'):
+        self._manager = manager
+        self._pending: List[Tuple[asyncio.Future, str, float, float]] = []
+        self._scheduled = False
+
+    def submit(self, trading_pair: str, size: float, price: float) -> asyncio.Future:
+        """Queue a validation and return a future for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((future, trading_pair, size, price))
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._run)
+        return future
+
+    def _run(self) -> None:
+        pending = [item for item in self._pending if not item[0].done()]
+        self._pending = []
+        self._scheduled = False
+        if not pending:
+            return
+        futures, pairs, sizes, prices = zip(*pending)
+        try:
+            results = self._manager.validate_new_positions_batch(pairs, sizes, prices)
+        except Exception as e:
+            self._manager.logger.error(f"Position validation error: {str(e)}")
+            results = [False] * len(futures)
+        for future, valid in zip(futures, results):
+            future.set_result(bool(valid))
 
 class EmergencyManager:
+    # __weakref__ is kept so instances can sit in _pending_managers
+    __slots__ = (
+        'logger', 'state_file', 'config_path', 'emergency_mode',
+        'position_limits', 'max_positions', 'risk_limits',
+        'emergency_thresholds', '_dirty', '_last_flush', '_state_hash',
+        '_saved_state', '_write_lock', '_pending_lock', '_snapshot_seq', '_written_seq', '_batcher', '_flush_handle', '_flush_loop',
+        '__weakref__'
+    )
+
+    # Minimum seconds between two non-forced state writes
+    FLUSH_INTERVAL = 0.1
+    # Also fsync the state directory so the rename itself survives a crash
+    DURABLE = True
+
     def __init__(self, config: Union[str, Path, Dict], state_file: str = "emergency_state.json"):
         """
         Initialize EmergencyManager with either a config path or direct configuration
@@ -27,6 +190,22 @@ class EmergencyManager:
         self.max_positions = {}
         self.risk_limits = {}
         self.emergency_thresholds = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._state_hash: Optional[str] = None
+        # (emergency_mode, position_limits items) of the last snapshot taken
+        self._saved_state: Optional[Tuple] = None
+        # Serializes file writes between the event loop and worker threads;
+        # the sequence numbers stop an older snapshot overwriting a newer one
+        self._write_lock = threading.Lock()
+        # Guards _dirty together with membership of _pending_managers
+        self._pending_lock = threading.Lock()
+        self._snapshot_seq = 0
+        self._written_seq = 0
+        self._batcher = _ValidationBatcher(self)
+        # Pending loop.call_later flush for saves held back by FLUSH_INTERVAL
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Load configuration
         if isinstance(config, (str, Path)):
@@ -45,9 +224,8 @@ class EmergencyManager:
     def _load_config_from_file(self) -> None:
         """Load emergency configuration from file."""
         try:
-            with open(self.config_path) as f:
-                config = json.load(f)
-            self._load_config_from_dict(config)
+            st = os.stat(self.config_path)
+            self._apply_limits(*_load_limits_cached(str(self.config_path), st.st_mtime_ns, st.st_size))
         except Exception as e:
             self.logger.error(f"Failed to load emergency config file: {str(e)}")
             raise
@@ -60,32 +238,42 @@ class EmergencyManager:
             config: Configuration dictionary
         """
         try:
-            # Convert string values to Decimal with explicit logging
-            self.max_positions = {}
-            for k, v in config.get('max_positions', {}).items():
-                self.max_positions[k] = Decimal(str(v))
-                self.logger.debug(f"Set max position for {k}: {self.max_positions[k]}")
-            
-            self.risk_limits = {
-                k: Decimal(str(v)) for k, v in config.get('risk_limits', {}).items()
-            }
-            self.emergency_thresholds = {
-                k: Decimal(str(v)) for k, v in config.get('emergency_thresholds', {}).items()
-            }
-            
-            # Initialize position limits to zero if not loaded from state
-            for pair in self.max_positions.keys():
-                if pair not in self.position_limits:
-                    self.position_limits[pair] = Decimal('0')
-            
+            self._apply_limits(*_parse_limits(config))
         except Exception as e:
             self.logger.error(f"Failed to load emergency config: {str(e)}")
             raise
 
+    def _apply_limits(self, max_positions: Mapping[str, Decimal],
+                      risk_limits: Mapping[str, Decimal],
+                      emergency_thresholds: Mapping[str, Decimal]) -> None:
+        """Install Decimal limit tables as this manager's own mutable dicts."""
+        self.max_positions = dict(max_positions)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for k, v in self.max_positions.items():
+                self.logger.debug("Set max position for %s: %s", k, v)
+        self.risk_limits = dict(risk_limits)
+        self.emergency_thresholds = dict(emergency_thresholds)
+
+        # Initialize position limits to zero if not loaded from state
+        for pair in self.max_positions.keys():
+            if pair not in self.position_limits:
+                self.position_limits[pair] = _ZERO
+
     async def validate_new_position(self, trading_pair: str, size: float, price: float) -> bool:
         """
         Validate if a new position can be taken based on current system state and limits.
 
+        Coroutine wrapper around validate_new_position_sync for async callers.
+
+        Returns:
+            True if position is valid, False otherwise
+        """
+        return self.validate_new_position_sync(trading_pair, size, price)
+
+    def validate_new_position_sync(self, trading_pair: str, size: float, price: float) -> bool:
+        """
+        Validate if a new position can be taken based on current system state and limits.
+
         Args:
             trading_pair: The trading pair for the position
             size: Position size
@@ -99,45 +287,54 @@ class EmergencyManager:
                 self.logger.warning("Position validation failed: System in emergency mode")
                 return False
 
-            size_dec = Decimal(str(size))
-            price_dec = Decimal(str(price))
-            position_value = size_dec * price_dec
-            
-            current_exposure = self.position_limits.get(trading_pair, Decimal('0'))
-            max_allowed = self.max_positions.get(trading_pair, Decimal('0'))
+            # Cheapest rejections first: unknown pairs never reach the arithmetic
+            max_allowed = self.max_positions.get(trading_pair)
+            if max_allowed is None:
+                self.logger.warning(
+                    "Position validation failed: No position limit configured for %s", trading_pair
+                )
+                return False
+
+            # Exact checks reuse Decimal arguments as passed, without a str round trip
+            size_arg, price_arg = size, price
+            exact_size = lambda: _as_decimal(size_arg)
+            size = float(size)
+            price = float(price)
+            current_exposure = self.position_limits.get(trading_pair, 0)
             
             # Log validation values
-            self.logger.debug(f"""
-            Validating position:
-            Trading Pair: {trading_pair}
-            Size: {size_dec}
-            Price: {price_dec}
-            Position Value: {position_value}
-            Current Exposure: {current_exposure}
-            Max Allowed: {max_allowed}
-            """)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Validating position: pair=%s size=%s price=%s current=%s max=%s",
+                    trading_pair, size, price, current_exposure, max_allowed
+                )
 
             # Check against position limits
-            if current_exposure + size_dec > max_allowed:
+            if _exceeds(float(current_exposure) + size, max_allowed,
+                        lambda: _as_decimal(current_exposure) + exact_size()):
                 self.logger.warning(
-                    f"Position validation failed: Would exceed position limit for {trading_pair}. "
-                    f"Current: {current_exposure}, New: {size_dec}, Max: {max_allowed}"
+                    "Position validation failed: Would exceed position limit for %s. "
+                    "Current: %s, New: %s, Max: %s",
+                    trading_pair, current_exposure, size, max_allowed
                 )
                 return False
 
+            position_value = size * price
+            exact_value = lambda: exact_size() * _as_decimal(price_arg)
+
             # Check risk limits
-            risk_limit = self.risk_limits.get(trading_pair, Decimal('0'))
-            if position_value > risk_limit:
+            risk_limit = self.risk_limits.get(trading_pair, 0)
+            if _exceeds(position_value, risk_limit, exact_value):
                 self.logger.warning(
-                    f"Position validation failed: Exceeds risk limit for {trading_pair}"
+                    "Position validation failed: Exceeds risk limit for %s", trading_pair
                 )
                 return False
 
             # Check emergency thresholds
-            threshold = self.emergency_thresholds.get(trading_pair, Decimal('inf'))
-            if position_value > threshold:
+            threshold = self.emergency_thresholds.get(trading_pair, _INF)
+            if _exceeds(position_value, threshold, exact_value):
                 self.logger.warning(
-                    f"Position validation failed: Would trigger emergency threshold for {trading_pair}"
+                    "Position validation failed: Would trigger emergency threshold for %s", trading_pair
                 )
                 return False
 
@@ -147,48 +344,244 @@ class EmergencyManager:
             self.logger.error(f"Position validation error: {str(e)}")
             return False
 
+    def validate_new_positions_batch(self, trading_pairs: Sequence[str],
+                                     sizes: Sequence[float],
+                                     prices: Sequence[float]) -> np.ndarray:
+        """
+        Validate many new positions at once with the same rules as validate_new_position.
+
+        Args:
+            trading_pairs: Trading pair of each position
+            sizes: Position sizes
+            prices: Current prices
+
+        Returns:
+            Boolean array, True where the position is valid
+        """
+        count = len(trading_pairs)
+        if self.emergency_mode:
+            self.logger.warning("Position validation failed: System in emergency mode")
+            return np.zeros(count, dtype=bool)
+
+        def limits(table: Dict, default) -> np.ndarray:
+            return np.fromiter((float(table.get(pair, default)) for pair in trading_pairs),
+                               dtype=np.float64, count=count)
+
+        sizes = np.asarray(sizes, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        values = sizes * prices
+        totals = limits(self.position_limits, 0) + sizes
+        max_allowed = limits(self.max_positions, 0)
+        risk = limits(self.risk_limits, 0)
+        threshold = limits(self.emergency_thresholds, _INF)
+
+        known = np.fromiter((pair in self.max_positions for pair in trading_pairs),
+                            dtype=bool, count=count)
+        valid = known & (totals <= max_allowed) & (values <= risk) & (values <= threshold)
+
+        # Rows sitting on a limit are settled exactly, one at a time
+        near = known & (_near_limit(totals, max_allowed) | _near_limit(values, risk)
+                        | _near_limit(values, threshold))
+        for i in np.flatnonzero(near):
+            pair = trading_pairs[i]
+            size = Decimal(str(float(sizes[i])))
+            value = size * Decimal(str(float(prices[i])))
+            exposure = _as_decimal(self.position_limits.get(pair, _ZERO))
+            valid[i] = not (
+                exposure + size > _as_decimal(self.max_positions.get(pair, _ZERO))
+                or value > _as_decimal(self.risk_limits.get(pair, _ZERO))
+                or value > _as_decimal(self.emergency_thresholds.get(pair, _INF))
+            )
+        return valid
+
+    async def validate_new_position_coalesced(self, trading_pair: str, size: float, price: float) -> bool:
+        """
+        Validate a new position, batched with any other validations awaited in the same tick.
+
+        Useful when many orders are checked concurrently, e.g. via asyncio.gather.
+
+        Returns:
+            True if position is valid, False otherwise
+        """
+        return await self._batcher.submit(trading_pair, size, price)
+
     def _load_state(self) -> None:
         """Load emergency state from persistence file."""
         try:
             # Always initialize position_limits to zero for clean state
             self.position_limits = {
-                pair: Decimal('0') for pair in self.max_positions.keys()
+                pair: _ZERO for pair in self.max_positions.keys()
+            }
+            try:
+                state, self._state_hash = _read_state_file(self.state_file)
+            except FileNotFoundError:
+                return  # no saved state; keep the zero positions above
+            self.emergency_mode = state.get('emergency_mode', False)
+            self.position_limits = {
+                k: Decimal(str(v)) for k, v in state.get('position_limits', {}).items()
             }
-            if self.state_file.exists():
-                with open(self.state_file) as f:
-                    state = json.load(f)
-                self.emergency_mode = state.get('emergency_mode', False)
-                self.position_limits = {
-                    k: Decimal(str(v)) for k, v in state.get('position_limits', {}).items()
-                }
-            else:
-                # Initialize with zero positions if no state exists
-                self.position_limits = {
-                    pair: Decimal('0') for pair in self.max_positions.keys()
-                }
         except Exception as e:
             self.logger.error(f"Failed to load emergency state: {str(e)}")
             self._save_state()  # Create new state file if loading fails
 
-    def _save_state(self) -> None:
-        """Save current emergency state to persistence file."""
+    def _save_state(self, force: bool = False) -> None:
+        """
+        Mark emergency state as changed and persist it.
+
+        Inside a running event loop the write never happens on the loop
+        thread: the state is only marked dirty, and the latest snapshot is
+        written by one deferred flush in the default executor at the end of
+        the FLUSH_INTERVAL batching window. Without a running loop nothing
+        would run that flush, so the state is written immediately.
+
+        Args:
+            force: Write immediately on the calling thread, even inside a
+                running event loop
+        """
+        if self._unchanged():
+            return
+        self._mark_dirty()
         try:
-            state = {
-                'emergency_mode': self.emergency_mode,
-                'position_limits': {k: str(v) for k, v in self.position_limits.items()},
-                'timestamp': datetime.utcnow().isoformat()
-            }
-            
-            # Ensure directory exists
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write state with atomic operation
-            temp_file = self.state_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(state, f, indent=2)
-            temp_file.replace(self.state_file)
-            
+            asyncio.get_running_loop()
+        except RuntimeError:
+            force = True
+        if force:
+            self._flush()
+        else:
+            self._schedule_flush()
+
+    def _mark_dirty(self) -> None:
+        """Flag unsaved state and register it for the atexit flush."""
+        with self._pending_lock:
+            self._dirty = True
+            _pending_managers.add(self)
+
+    def _schedule_flush(self) -> None:
+        """Arrange one off-loop write for the end of the batching window."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop: the next save or the atexit hook writes it
+        if self._flush_handle is not None:
+            if self._flush_loop is loop:
+                return
+            # Left over from a loop that stopped before it fired
+            self._flush_handle.cancel()
+        delay = max(0.0, self.FLUSH_INTERVAL - (time.monotonic() - self._last_flush))
+        self._flush_handle = loop.call_later(delay, self._deferred_flush)
+        self._flush_loop = loop
+
+    def _deferred_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_loop = None
+        if not self._dirty:
+            return
+        future = asyncio.get_running_loop().run_in_executor(
+            None, self._write_snapshot, *self._snapshot()
+        )
+        # _write_snapshot logs its own failures; mark the result retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def _flush(self) -> None:
+        """Write pending state to the persistence file in a single write."""
+        if not self._dirty:
+            return
+        self._write_snapshot(*self._snapshot())
+
+    async def _save_state_async(self) -> None:
+        """
+        Persist emergency state without blocking the event loop.
+
+        The state is snapshotted on the calling thread, so concurrent tasks
+        cannot mutate it mid-serialization; only the file I/O runs in a
+        worker thread.
+        """
+        if self._unchanged():
+            return
+        self._mark_dirty()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_snapshot, *self._snapshot())
+
+    async def flush(self) -> None:
+        """Write any state still pending from batched saves."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+        if self._dirty:
+            await self._save_state_async()
+
+    async def aclose(self) -> None:
+        """Flush pending state before the manager is discarded."""
+        await self.flush()
+
+    def _state_key(self) -> Tuple:
+        return self.emergency_mode, tuple(self.position_limits.items())
+
+    def _unchanged(self) -> bool:
+        """True if nothing is pending and the state matches the last snapshot."""
+        return not self._dirty and self._saved_state == self._state_key()
+
+    def _snapshot(self) -> Tuple[int, bytes]:
+        """Serialize the current state and mark it clean."""
+        self._saved_state = self._state_key()
+        state = {
+            'emergency_mode': self.emergency_mode,
+            'position_limits': self.position_limits,
+            'timestamp': _now_iso()
+        }
+        payload = json_dumps(state, default=str, newline=True)
+        self._snapshot_seq += 1
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        return self._snapshot_seq, payload
+
+    def _write_snapshot(self, seq: int, payload: bytes) -> None:
+        """Atomically replace the state file with a serialized snapshot."""
+        try:
+            with self._write_lock:
+                if seq <= self._written_seq:
+                    return  # a newer snapshot is already on disk
+
+                # Ensure directory exists
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+                # Write state with atomic operation
+                temp_file = self.state_file.with_suffix('.tmp')
+                fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DSYNC, 0o644)
+                try:
+                    _write_all(fd, payload)
+                    if not _O_DSYNC:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+                # Read the temp file back so a bad write never replaces good state
+                state_hash = hashlib.sha256(payload).hexdigest()
+                with open(temp_file, 'rb') as f:
+                    written_hash = hashlib.sha256(f.read()).hexdigest()
+                if written_hash != state_hash:
+                    temp_file.unlink()
+                    raise OSError(f"State file verification failed for {temp_file}")
+                temp_file.replace(self.state_file)
+                if self.DURABLE and hasattr(os, 'O_DIRECTORY'):
+                    dir_fd = os.open(self.state_file.parent, os.O_RDONLY | os.O_DIRECTORY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+
+                # Hash once per write so health queries never re-serialize state
+                self._state_hash = state_hash
+                self._written_seq = seq
+
+                # Leave the atexit set only if no newer snapshot is pending
+                with self._pending_lock:
+                    if seq == self._snapshot_seq and not self._dirty:
+                        _pending_managers.discard(self)
         except Exception as e:
+            self._dirty = True
+            self._saved_state = None
             self.logger.error(f"Failed to save emergency state: {str(e)}")
             raise
 
@@ -196,7 +589,7 @@ class EmergencyManager:
         """Initiate emergency shutdown procedure."""
         try:
             self.emergency_mode = True
-            self._save_state()
+            await self._save_state_async()
             self.logger.warning("Emergency shutdown completed")
         except Exception as e:
             self.logger.error(f"Emergency shutdown error: {str(e)}")
@@ -220,13 +613,13 @@ class EmergencyManager:
 
             # Verify all positions are within limits
             for pair, current in self.position_limits.items():
-                max_allowed = self.max_positions.get(pair, Decimal('0'))
+                max_allowed = self.max_positions.get(pair, _ZERO)
                 if current > max_allowed:
                     self.logger.warning(f"Position {pair} exceeds limits during restoration attempt")
                     return False
 
             self.emergency_mode = False
-            self._save_state()
+            await self._save_state_async()
             self.logger.info("Normal operation restored")
             return True
 
@@ -234,6 +627,47 @@ class EmergencyManager:
             self.logger.error(f"Restoration error: {str(e)}")
             return False
 
+    def update_position_limits(self, limits: Dict[str, Union[float, Decimal]]) -> None:
+        """
+        Set current position sizes for the given trading pairs.
+
+        Args:
+            limits: Position size per trading pair
+
+        Raises:
+            ValueError: If any position size is negative
+        """
+        updates = {pair: Decimal(str(size)) for pair, size in limits.items()}
+        negative = [pair for pair, size in updates.items() if size < 0]
+        if negative:
+            raise ValueError(f"Negative position limits for: {', '.join(negative)}")
+        self.position_limits.update(updates)
+        self._save_state()
+
+    def get_system_health(self) -> Dict:
+        """
+        Get current emergency system status.
+
+        Returns:
+            Dictionary with emergency mode, position limits, exposure
+            percentages and the hash of the last persisted state
+        """
+        # Reported as floats, so one float conversion per value replaces the
+        # Decimal divide and multiply per pair
+        position_limits = {k: float(v) for k, v in self.position_limits.items()}
+        exposure_percentages = {}
+        for pair, current in position_limits.items():
+            max_allowed = self.max_positions.get(pair)
+            if max_allowed:
+                exposure_percentages[pair] = current * 100.0 / float(max_allowed)
+        return {
+            'emergency_mode': self.emergency_mode,
+            'position_limits': position_limits,
+            'exposure_percentages': exposure_percentages,
+            'state_hash': self._state_hash,
+            'timestamp': _now_iso()
+        }
+
     async def _verify_system_health(self) -> bool:
         """
         Verify system health status before restoration.
@@ -247,17 +681,18 @@ class EmergencyManager:
                 return True
                 
             # Verify position data consistency
-            for pair in self.position_limits:
-                if pair not in self.max_positions:
-                    self.logger.error(f"Missing max position data for {pair}")
-                    return False
-            
+            pairs = self.position_limits.keys()
+            missing = pairs - self.max_positions.keys()
+            if missing:
+                self.logger.error(f"Missing max position data for {', '.join(sorted(missing))}")
+                return False
+
             # Verify risk limits are properly set
-            for pair in self.position_limits:
-                if pair not in self.risk_limits:
-                    self.logger.error(f"Missing risk limit data for {pair}")
-                    return False
-            
+            missing = pairs - self.risk_limits.keys()
+            if missing:
+                self.logger.error(f"Missing risk limit data for {', '.join(sorted(missing))}")
+                return False
+
             return True
             
         except Exception as e:
@@ -6,7 +6,7 @@ It handles order execution, market data retrieval, and account management while
 proper error handling and system monitoring.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from decimal import Decimal
 import logging
@@ -14,6 +14,7 @@ import json
 from pathlib import Path
 
 from .coinbase_api import (
+    AsyncCoinbaseAdvancedClient,
     CoinbaseAdvancedClient,
     CoinbaseApiError,
     OrderRequest,
@@ -245,4 +246,30 @@ class ExchangeService:
             return self.client.get_trades(product_id)
         except CoinbaseApiError as e:
             logger.error(f"Failed to get recent trades: {str(e)}")
-            raise ExchangeServiceError(f"Failed to get recent trades: {str(e)}")
\ No newline at end of file
+            raise ExchangeServiceError(f"Failed to get recent trades: {str(e)}")
+
+    async def start_price_feed(self, symbols: List[str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream ticker updates pushed by the exchange WebSocket feed
+        
+        Yields:
+            Decoded messages of the form {"type": "ticker", "symbol": ..., "price": ...}
+        """
+        client = AsyncCoinbaseAdvancedClient(self.credentials)
+        try:
+            async for message in client.stream(symbols):
+                for event in message.get("events", ()):
+                    for ticker in event.get("tickers", ()):
+                        symbol = ticker.get("product_id")
+                        price = ticker.get("price")
+                        if symbol is None or price is None:
+                            # One bad event must not end the feed
+                            logger.warning(f"Skipping malformed ticker event: {ticker}")
+                            continue
+                        yield {
+                            "type": "ticker",
+                            "symbol": symbol,
+                            "price": price
+                        }
+        finally:
+            await client.close()
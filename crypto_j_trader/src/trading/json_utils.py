@@ -0,0 +1,62 @@
+"""
+Shared JSON encoding, decoding and file loading.
+
+orjson is used when installed; the stdlib json module produces the same
+documents otherwise.
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse a JSON document from raw bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None,
+               newline: bool = False) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        default: Called for objects the encoder cannot handle, e.g. str for Decimal
+        newline: Terminate the document with a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+    data = json.dumps(obj, separators=(',', ':'), default=default).encode('utf-8')
+    return data + b'\n' if newline else data
+
+@functools.lru_cache(maxsize=32)
+def _read_json_cached(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a JSON file's raw bytes once per (path, mtime, size) key.
+
+    The stat fields are part of the cache key so an edited file is re-read
+    on the next lookup. Only the immutable bytes are cached; every caller
+    parses its own copy of the document.
+    """
+    return Path(path_str).read_bytes()
+
+def load_json_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a JSON file through the shared read cache.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Freshly parsed document, safe for the caller to mutate
+    """
+    path = Path(path)
+    st = path.stat()
+    return json_loads(_read_json_cached(str(path), st.st_mtime_ns, st.st_size))
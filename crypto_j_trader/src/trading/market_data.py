@@ -131,7 +131,8 @@ class MarketDataService:
                     break
 
                 try:
-                    data = json.loads(message)
+                    # The exchange feed yields decoded dicts; raw JSON text is still accepted
+                    data = message if isinstance(message, dict) else json.loads(message)
                     if data.get("type") == "ticker" and "symbol" in data and "price" in data:
                         symbol = data["symbol"]
                         price = float(data["price"])
@@ -18,6 +18,9 @@ class PositionManager:
             'max_leverage': 3.0,  # Maximum leverage
             'min_position_size': 0.001  # Minimum position size
         })
+        # Sizing parameters read once here rather than on every sizing call
+        self.risk_per_trade = float(config.get('risk_per_trade', 0.02))  # 2% risk per trade
+        self.size_precision = config.get('size_precision') or {}
 
     def calculate_position_size(self, trading_pair: str, account_value: float, 
                               current_price: float, volatility: float) -> float:
@@ -35,7 +38,7 @@ class PositionManager:
         """
         try:
             # Get risk parameters from config
-            risk_per_trade = self.config.get('risk_per_trade', 0.02)  # 2% risk per trade
+            risk_per_trade = self.risk_per_trade
             max_position_value = self.position_limits['max_position_value']
             
             # Calculate base position size from account value
@@ -52,7 +55,7 @@ class PositionManager:
             position_size = position_value / current_price
             
             # Round to appropriate precision
-            precision = self.config.get('size_precision', {}).get(trading_pair, 8)
+            precision = self.size_precision.get(trading_pair, 8)
             position_size = round(position_size, precision)
             
             # Ensure above minimum size
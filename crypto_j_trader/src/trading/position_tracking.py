@@ -0,0 +1,83 @@
+"""
+Position Tracking Module
+Implements basic position tracking functionality.
+
+Quantities and entry prices are held internally as integer fixed-point
+values (1e-8 units) so the per-trade VWAP update is native int arithmetic.
+Decimal is only used at the API boundary.
+"""
+
+from decimal import Decimal
+from typing import Dict, Optional, Union
+
+# Fixed-point scale: 1 unit == 1e-8 (satoshi precision)
+SCALE = 10 ** 8
+
+def to_fixed(value: Union[Decimal, float, int, str]) -> int:
+    """Convert a Decimal (or numeric) amount to scaled integer units."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * SCALE).to_integral_value())
+
+def to_decimal(value: int) -> Decimal:
+    """Convert scaled integer units back to a Decimal amount."""
+    return Decimal(value).scaleb(-8)
+
+class PositionTracker:
+    __slots__ = ('positions',)
+
+    def __init__(self):
+        self.positions = {}  # Keys are trading pairs, values are dicts with 'quantity_e8' and 'entry_price_e8'
+
+    def update_position(self, symbol: str, side: str, size: Decimal, price: Decimal):
+        """
+        Updates the position tracking based on the trade.
+        Args:
+            symbol: The trading pair
+            side: 'buy' or 'sell'
+            size: The size of the trade
+            price: The price at which the trade was executed.
+        """
+        if not isinstance(size, Decimal):
+            size = Decimal(str(size))
+        q = to_fixed(size)
+        # Sizes must be exact in fixed point: a sub-1e-8 size would round to a
+        # zero-quantity position and break the VWAP division on the next buy
+        if q <= 0 or to_decimal(q) != size:
+            raise ValueError(f"Trade size must be a positive multiple of 1e-8, got {size}")
+        if side == 'buy':
+            p = to_fixed(price)
+            if symbol not in self.positions:
+                self.positions[symbol] = {'quantity_e8': q, 'entry_price_e8': p}
+            else:
+                current_position = self.positions[symbol]
+                cur_q = current_position['quantity_e8']
+                new_quantity = cur_q + q
+                current_position['entry_price_e8'] = (
+                    cur_q * current_position['entry_price_e8'] + q * p
+                ) // new_quantity
+                current_position['quantity_e8'] = new_quantity
+        elif side == 'sell':
+            current_position = self.positions.get(symbol)
+            if current_position is None:
+                raise ValueError("No position exists")
+            cur_q = current_position['quantity_e8']
+            if q > cur_q:
+                raise ValueError("Insufficient position size")
+            new_quantity = cur_q - q
+            if new_quantity == 0:
+                self.positions.pop(symbol)
+            else:
+                current_position['quantity_e8'] = new_quantity
+
+    def get_position(self, symbol: str) -> Optional[Dict]:
+        """
+        Returns the current position for a symbol or None if no position
+        """
+        position = self.positions.get(symbol)
+        if position is None:
+            return None
+        return {
+            'quantity': to_decimal(position['quantity_e8']),
+            'entry_price': to_decimal(position['entry_price_e8'])
+        }
@@ -9,6 +9,11 @@ class RiskManager:
     RiskManager handles risk assessment and management for trading operations.
     """
 
+    __slots__ = (
+        'risk_threshold', 'market_data_service', 'logger', 'volatility_threshold',
+        'max_position_value', 'min_position_value', 'min_liquidity_ratio'
+    )
+
     def __init__(self, risk_threshold: float, market_data_service: Optional[MarketDataService] = None) -> None:
         """
         Initialize RiskManager with risk threshold and optional market data service.
@@ -33,11 +33,21 @@ class WebSocketHandler:
         self.subscriptions: Set[str] = set()
         self.is_connected = False
         self.should_reconnect = True
-        self.last_message_time = datetime.utcnow()
+        # Monotonic time of the last message or pong; see last_message_time
+        self._last_message_at = time.monotonic()
         self.connection_attempts = 0
         self.max_reconnect_delay = 300  # Maximum reconnection delay in seconds
         self.connection_tasks = set()
 
+    @property
+    def last_message_time(self) -> datetime:
+        """UTC time of the last message or pong, derived from the monotonic clock."""
+        return datetime.utcnow() - timedelta(seconds=time.monotonic() - self._last_message_at)
+
+    @last_message_time.setter
+    def last_message_time(self, value: datetime) -> None:
+        self._last_message_at = time.monotonic() - (datetime.utcnow() - value).total_seconds()
+
     def _start_background_tasks(self) -> None:
         """Start background tasks for connection management."""
         self.connection_tasks = set()
@@ -198,7 +208,7 @@ class WebSocketHandler:
                     await pong_waiter
                     latency = (time.time() - ping_start) * 1000
                     await self.health_monitor.record_latency('websocket_ping', latency)
-                    self.last_message_time = datetime.utcnow()
+                    self._last_message_at = time.monotonic()
             except Exception as e:
                 self.logger.error(f"Heartbeat error: {str(e)}")
                 await self._handle_connection_error()
@@ -212,7 +222,7 @@ class WebSocketHandler:
                     continue
 
                 message = await self.websocket.recv()
-                self.last_message_time = datetime.utcnow()
+                self._last_message_at = time.monotonic()
 
                 if self.message_handler:
                     start_time = time.time()
@@ -239,7 +249,7 @@ class WebSocketHandler:
                 if not self.websocket: continue
                 if self.is_connected:
                     # Check last message time
-                    time_since_last = (datetime.utcnow() - self.last_message_time).total_seconds()
+                    time_since_last = time.monotonic() - self._last_message_at
                     
                     if time_since_last > self.ping_interval * 2:
                         self.logger.warning(f"No messages received for {time_since_last} seconds")
@@ -9,7 +9,9 @@ from crypto_j_trader.src.trading.emergency_manager import EmergencyManager
 from crypto_j_trader.src.trading.market_data_handler import MarketDataHandler
 
 # Mark all tests in this module as integration tests
-pytestmark = [pytest.mark.integration]
+# EmergencyManager here persists to the default emergency_state.json in the
+# working directory, so keep these tests on a single xdist worker
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group(name="emergency_state")]
 
 @pytest.fixture
 def reset_emergency_manager():
@@ -1,5 +1,6 @@
 """Test script for EmergencyManager functionality"""
 import asyncio
+import pytest
 import pandas as pd
 from datetime import datetime, timedelta
 import json
@@ -7,6 +8,9 @@ import os
 
 from crypto_j_trader.src.trading.emergency_manager import EmergencyManager
 
+# Uses a fixed state file in the working directory; keep on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="emergency_state")
+
 async def test_emergency_manager():
     """Run comprehensive tests for EmergencyManager"""
     
@@ -1,10 +1,15 @@
 """Unit tests for Coinbase Advanced Trade API client"""
 import pytest
 import json
-from unittest.mock import patch, mock_open, MagicMock, create_autospec
+import hmac
+import hashlib
+import inspect
+from unittest.mock import patch, mock_open, Mock, AsyncMock
+import aiohttp
 import requests
 
 from crypto_j_trader.src.trading.coinbase_api import (
+    AsyncCoinbaseAdvancedClient,
     CoinbaseAdvancedClient,
     CoinbaseApiError,
     OrderRequest,
@@ -19,19 +24,33 @@ def api_credentials() -> ApiCredentials:
         "api_secret": "test_secret"
     }
 
+class _ResponseStub:
+    """requests.Response stand-in whose raw body mirrors json.return_value"""
+    def __init__(self):
+        self.status_code = 200
+        self.raise_for_status = Mock()
+        self.json = Mock()
+
+    @property
+    def content(self):
+        return json.dumps(self.json.return_value).encode()
+
+class _SessionStub:
+    """Lightweight stand-in for requests.Session; the client only calls mount() and request()"""
+    def __init__(self):
+        mock_response = _ResponseStub()
+        mock_response.json.return_value = {
+            "order_id": "test_order_123",
+            "product_id": "BTC-USD",
+            "status": "pending"
+        }
+        self.mount = Mock()
+        self.request = Mock(return_value=mock_response)
+
 @pytest.fixture
 def mock_session():
     """Create a mock session with proper request method"""
-    session = create_autospec(requests.Session, instance=True)
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "order_id": "test_order_123",
-        "product_id": "BTC-USD",
-        "status": "pending"
-    }
-    session.request.return_value = mock_response
-    return session
+    return _SessionStub()
 
 @pytest.fixture
 def client(api_credentials, mock_session):
@@ -72,6 +91,13 @@ def test_sign_message(client):
     assert isinstance(signature, str)
     assert len(signature) == 64  # SHA256 hex digest length
 
+def test_sign_message_reuses_key(client):
+    """Test repeated signatures match a freshly keyed HMAC"""
+    expected = hmac.new(b"test_secret", b"1612345678GET/orders", hashlib.sha256).hexdigest()
+
+    assert client._sign_message("1612345678", "GET", "/orders") == expected
+    assert client._sign_message("1612345678", "GET", "/orders") == expected
+
 def test_create_order_success(client, mock_session):
     """Test successful order creation"""
     order = OrderRequest(
@@ -87,7 +113,7 @@ def test_create_order_success(client, mock_session):
     args = mock_session.request.call_args
     assert args[0][0] == "POST"  # Method
     assert "orders" in args[0][1]  # URL
-    assert isinstance(args[1]["json"], dict)  # Order payload
+    assert isinstance(json.loads(args[1]["data"]), dict)  # Order payload
     assert response == mock_session.request.return_value.json()
 
 def test_create_limit_order(client, mock_session):
@@ -105,8 +131,9 @@ def test_create_limit_order(client, mock_session):
     mock_session.request.assert_called_once()
     args = mock_session.request.call_args
     assert args[0][0] == "POST"
-    assert isinstance(args[1]["json"], dict)
-    assert "limit" in str(args[1]["json"])
+    payload = json.loads(args[1]["data"])
+    assert isinstance(payload, dict)
+    assert "limit" in payload["order_configuration"]
     assert response == mock_session.request.return_value.json()
 
 def test_create_order_error(client, mock_session):
@@ -124,6 +151,15 @@ def test_create_order_error(client, mock_session):
         client.create_order(order)
     assert "API request failed" in str(exc_info.value)
 
+def test_non_json_response_raises_api_error(client, mock_session):
+    """Test a 2xx response with a non-JSON body is raised as CoinbaseApiError"""
+    mock_session.request.return_value = Mock(status_code=200, content=b"<html>Bad Gateway</html>")
+
+    with pytest.raises(CoinbaseApiError) as exc_info:
+        client.get_order("test_order_123")
+    assert "Invalid JSON" in str(exc_info.value)
+    assert exc_info.value.status_code == 200
+
 def test_get_order_success(client, mock_session):
     """Test getting order details"""
     response = client.get_order("test_order_123")
@@ -190,4 +226,133 @@ def test_get_product_book_success(client, mock_session):
     args = mock_session.request.call_args
     assert args[0][0] == "GET"
     assert "products/BTC-USD/book" in args[0][1]
-    assert response == mock_session.request.return_value.json()
\ No newline at end of file
+    assert response == mock_session.request.return_value.json()
+
+class _AsyncResponseStub:
+    """Minimal aiohttp response usable as an async context manager"""
+    def __init__(self, status: int, payload: dict):
+        self.status = status
+        self.reason = "OK" if status < 400 else "Bad Request"
+        self._body = json.dumps(payload).encode()
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+@pytest.fixture
+def async_client(api_credentials):
+    """Async API client whose session returns canned responses"""
+    client = AsyncCoinbaseAdvancedClient(api_credentials)
+    client.session = Mock(closed=False)
+    client.session.request = Mock(
+        side_effect=lambda method, url, **kwargs: _AsyncResponseStub(
+            200, {"product_id": url.rsplit("/", 2)[-2], "price": "50000.00"}
+        )
+    )
+    return client
+
+@pytest.mark.parametrize("name", [
+    "create_order", "get_order", "list_orders", "cancel_order", "get_product",
+    "get_product_book", "get_ticker", "get_trades", "get_account"
+])
+def test_async_client_mirrors_sync_endpoints(name):
+    """Test each sync endpoint has a coroutine counterpart rather than an inherited sync method"""
+    assert not issubclass(AsyncCoinbaseAdvancedClient, CoinbaseAdvancedClient)
+    assert callable(getattr(CoinbaseAdvancedClient, name))
+    assert inspect.iscoroutinefunction(getattr(AsyncCoinbaseAdvancedClient, name))
+
+@pytest.mark.asyncio
+async def test_async_get_tickers_concurrently(async_client):
+    """Test endpoint methods are awaitable and can be gathered"""
+    tickers = await async_client.get_tickers(["BTC-USD", "ETH-USD"])
+
+    assert [t["product_id"] for t in tickers] == ["BTC-USD", "ETH-USD"]
+    assert async_client.session.request.call_count == 2
+    method, url = async_client.session.request.call_args[0]
+    assert method == "GET"
+    assert url.endswith("/products/ETH-USD/ticker")
+
+@pytest.mark.asyncio
+async def test_async_create_order_signs_sent_body(async_client):
+    """Test the signed body is exactly the body sent"""
+    order = OrderRequest(product_id="BTC-USD", side="buy", order_type="market", size="0.01")
+
+    with patch.object(async_client, "_generate_headers", wraps=async_client._generate_headers) as headers:
+        await async_client.create_order(order)
+
+    signed_body = headers.call_args[0][2]
+    assert async_client.session.request.call_args[1]["data"] == signed_body
+    assert json.loads(signed_body)["product_id"] == "BTC-USD"
+
+@pytest.mark.asyncio
+async def test_async_request_error(async_client):
+    """Test HTTP errors are raised as CoinbaseApiError"""
+    async_client.session.request = Mock(
+        return_value=_AsyncResponseStub(400, {"error": "INVALID_ARGUMENT"})
+    )
+
+    with pytest.raises(CoinbaseApiError) as exc_info:
+        await async_client.get_order("missing")
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.response == {"error": "INVALID_ARGUMENT"}
+
+@pytest.mark.asyncio
+async def test_async_non_json_response_raises_api_error(async_client):
+    """Test a 2xx response with an empty body is raised as CoinbaseApiError"""
+    response = _AsyncResponseStub(200, {})
+    response._body = b""
+    async_client.session.request = Mock(return_value=response)
+
+    with pytest.raises(CoinbaseApiError) as exc_info:
+        await async_client.get_order("test_order_123")
+    assert exc_info.value.status_code == 200
+
+@pytest.mark.asyncio
+async def test_async_stream_logs_connection_failures(async_client, caplog):
+    """Test failed feed connections are logged before reconnecting"""
+    async_client.session.ws_connect = Mock(side_effect=aiohttp.ClientError("refused"))
+
+    with patch("crypto_j_trader.src.trading.coinbase_api.asyncio.sleep",
+               side_effect=RuntimeError("stop")):
+        with pytest.raises(RuntimeError):
+            await async_client.stream(["BTC-USD"]).__anext__()
+
+    assert "WebSocket feed connection failed" in caplog.text
+
+class _WebSocketStub:
+    """Minimal aiohttp WebSocket connection replaying canned frames"""
+    def __init__(self, frames):
+        self._frames = frames
+        self.send_str = AsyncMock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for data in self._frames:
+            yield aiohttp.WSMessage(aiohttp.WSMsgType.TEXT, data, None)
+
+@pytest.mark.asyncio
+async def test_async_stream_skips_undecodable_frames(async_client, caplog):
+    """Test a malformed frame is logged and the feed keeps yielding"""
+    async_client.session.ws_connect = Mock(return_value=_WebSocketStub(
+        ['{"channel": "ticker"}', "not json", '{"channel": "heartbeats"}']
+    ))
+
+    feed = async_client.stream(["BTC-USD"])
+    messages = [await feed.__anext__(), await feed.__anext__()]
+    await feed.aclose()
+
+    assert messages == [{"channel": "ticker"}, {"channel": "heartbeats"}]
+    assert "Skipping undecodable WebSocket frame" in caplog.text
@@ -0,0 +1,83 @@
+"""Unit tests for the shared JSON helpers and cached config loader."""
+import os
+import json
+import pytest
+from decimal import Decimal, InvalidOperation
+from crypto_j_trader.src.trading.json_utils import (
+    _read_json_cached, json_dumps, json_loads, load_json_file
+)
+from config.config import TradingConfig
+from config.settings import BaseConfig
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "trading_config.json"
+    path.write_text(json.dumps({'trading_params': {'pairs': ['BTC-USD']}}))
+    return path
+
+def test_json_dumps_matches_stdlib_document():
+    data = json_dumps({'limit': Decimal('1.5'), 'pairs': ['BTC-USD']}, default=str, newline=True)
+    assert data == b'{"limit":"1.5","pairs":["BTC-USD"]}\n'
+    assert json_loads(memoryview(data)) == {'limit': '1.5', 'pairs': ['BTC-USD']}
+
+def test_repeat_load_hits_cache(config_path):
+    _read_json_cached.cache_clear()
+    load_json_file(config_path)
+    load_json_file(config_path)
+    assert _read_json_cached.cache_info().hits == 1
+
+def test_modified_file_is_reread(config_path):
+    assert load_json_file(config_path)['trading_params']['pairs'] == ['BTC-USD']
+
+    config_path.write_text(json.dumps({'trading_params': {'pairs': ['ETH-USD']}}))
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_json_file(config_path)['trading_params']['pairs'] == ['ETH-USD']
+
+def test_callers_get_independent_documents(config_path, tmp_path):
+    first = TradingConfig(str(config_path), str(tmp_path / "missing_key.json"))
+    first.trading_params['pairs'].append('ETH-USD')
+
+    second = TradingConfig(str(config_path), str(tmp_path / "missing_key.json"))
+    assert second.trading_params['pairs'] == ['BTC-USD']
+
+def test_cdp_key_file_created_later_is_read(config_path, tmp_path):
+    key_path = tmp_path / "cdp_api_key.json"
+    assert TradingConfig(str(config_path), str(key_path)).api_credentials == {}
+
+    key_path.write_text(json.dumps({'name': 'key', 'privateKey': 'secret'}))
+    first = TradingConfig(str(config_path), str(key_path))
+    assert first.api_credentials['name'] == 'key'
+
+    first.api_credentials['name'] = 'changed'
+    assert TradingConfig(str(config_path), str(key_path)).api_credentials['name'] == 'key'
+
+@pytest.fixture
+def settings_path(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({
+        'trading_pairs': ['BTC-USD'],
+        'websocket': {},
+        'risk_management': {'daily_loss_limit': 500, 'position_size_limit': 0.1}
+    }))
+    return path
+
+def test_risk_limits_cannot_be_mutated(settings_path):
+    config = BaseConfig(settings_path)
+    assert config.risk_limits == {'daily_loss_limit': Decimal('500'), 'position_size_limit': Decimal('0.1')}
+
+    with pytest.raises(TypeError):
+        config.risk_limits['daily_loss_limit'] = Decimal('0')
+    copy = config.get_risk_limits()
+    copy['daily_loss_limit'] = Decimal('0')
+
+    assert config.risk_limits['daily_loss_limit'] == Decimal('500')
+
+def test_boolean_risk_limit_is_rejected(settings_path):
+    document = json.loads(settings_path.read_text())
+    document['risk_management']['daily_loss_limit'] = True
+    settings_path.write_text(json.dumps(document))
+
+    with pytest.raises(InvalidOperation):
+        BaseConfig(settings_path).risk_limits
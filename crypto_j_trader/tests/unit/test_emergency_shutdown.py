@@ -1,10 +1,14 @@
 import pytest
+import os
 import json
+import asyncio
+import hashlib
+import threading
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, patch, Mock
-from ...src.trading.emergency_manager import EmergencyManager
+from ...src.trading.emergency_manager import EmergencyManager, _pending_managers
 
 @pytest.fixture
 def config_file(tmp_path):
@@ -82,6 +86,80 @@ async def test_validate_new_position_exceeds_risk(emergency_manager):
     )
     assert result is False
 
+@pytest.mark.asyncio
+async def test_validate_new_position_at_exact_limit(emergency_manager):
+    """Test a position landing exactly on the limit is not rejected by float rounding."""
+    emergency_manager.position_limits['ETH-USD'] = Decimal('0.1')
+    emergency_manager.max_positions['ETH-USD'] = Decimal('0.3')
+
+    result = await emergency_manager.validate_new_position(
+        'ETH-USD',
+        size=0.2,  # 0.1 + 0.2 > 0.3 in binary floating point
+        price=3000.0
+    )
+    assert result is True
+
+def test_validate_new_position_decimal_arguments(emergency_manager):
+    """Test Decimal sizes are compared exactly at the limit."""
+    emergency_manager.position_limits['BTC-USD'] = Decimal('9.9')
+    assert emergency_manager.validate_new_position_sync('BTC-USD', Decimal('0.1'), Decimal('40000')) is True
+    assert emergency_manager.validate_new_position_sync('BTC-USD', Decimal('0.1000001'), Decimal('40000')) is False
+
+def test_unbounded_threshold_stays_on_float_path(emergency_manager):
+    """Test a pair without an emergency threshold needs no Decimal re-check."""
+    del emergency_manager.emergency_thresholds['BTC-USD']
+    with patch('crypto_j_trader.src.trading.emergency_manager._as_decimal') as as_decimal:
+        assert emergency_manager.validate_new_position_sync('BTC-USD', 1.0, 40000.0) is True
+    as_decimal.assert_not_called()
+
+def test_validate_new_position_sync(emergency_manager):
+    """Test the synchronous validator needs no event loop."""
+    assert emergency_manager.validate_new_position_sync('BTC-USD', size=1.0, price=40000.0) is True
+    assert emergency_manager.validate_new_position_sync('BTC-USD', size=2.0, price=30000.0) is False
+
+def test_validate_new_positions_batch(emergency_manager):
+    """Test batch validation matches the single-position rules."""
+    emergency_manager.position_limits['ETH-USD'] = Decimal('0.1')
+    emergency_manager.max_positions['ETH-USD'] = Decimal('0.3')
+
+    result = emergency_manager.validate_new_positions_batch(
+        ['BTC-USD', 'BTC-USD', 'ETH-USD', 'SOL-USD'],
+        sizes=[1.0, 2.0, 0.2, 1.0],
+        prices=[40000.0, 30000.0, 3000.0, 10.0]  # valid, over risk, at limit, unknown pair
+    )
+    assert result.tolist() == [True, False, True, False]
+
+    emergency_manager.emergency_mode = True
+    assert not emergency_manager.validate_new_positions_batch(['BTC-USD'], [1.0], [40000.0]).any()
+
+def test_batch_unbounded_threshold_skips_decimal_fallback(emergency_manager):
+    """Test rows without an emergency threshold are decided fully in NumPy."""
+    emergency_manager.emergency_thresholds.clear()
+    with patch('crypto_j_trader.src.trading.emergency_manager._as_decimal') as as_decimal:
+        result = emergency_manager.validate_new_positions_batch(
+            ['BTC-USD', 'ETH-USD', 'BTC-USD', 'ETH-USD', 'BTC-USD'],
+            [1.0, 2.0, 0.5, 1.0, 20.0],
+            [40000.0, 3000.0, 40000.0, 3000.0, 40000.0]
+        )
+    assert result.tolist() == [True, True, True, True, False]
+    as_decimal.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_validate_new_position_coalesced(emergency_manager):
+    """Test concurrent validations are decided by a single batch call."""
+    with patch.object(
+        EmergencyManager, 'validate_new_positions_batch',
+        autospec=True, side_effect=EmergencyManager.validate_new_positions_batch
+    ) as batch:
+        results = await asyncio.gather(
+            emergency_manager.validate_new_position_coalesced('BTC-USD', 1.0, 40000.0),
+            emergency_manager.validate_new_position_coalesced('BTC-USD', 2.0, 30000.0),
+            emergency_manager.validate_new_position_coalesced('ETH-USD', 1.0, 3000.0)
+        )
+
+    assert results == [True, False, True]
+    assert batch.call_count == 1
+
 @pytest.mark.asyncio
 async def test_emergency_shutdown(emergency_manager):
     """Test emergency shutdown procedure."""
@@ -95,6 +173,130 @@ async def test_emergency_shutdown(emergency_manager):
         state = json.load(f)
         assert state['emergency_mode'] is True
 
+@pytest.mark.asyncio
+async def test_aclose_writes_batched_state(emergency_manager):
+    """Test a save held back by the batching window is written on aclose."""
+    await emergency_manager.emergency_shutdown()
+    emergency_manager.emergency_mode = False
+    emergency_manager._save_state()  # inside FLUSH_INTERVAL, only marked dirty
+
+    await emergency_manager.aclose()
+
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['emergency_mode'] is False
+
+@pytest.mark.asyncio
+async def test_burst_updates_flush_once_in_background(emergency_manager):
+    """Test saves inside the batching window are coalesced into one deferred write."""
+    emergency_manager.update_position_limits({'BTC-USD': 1.0})
+    with patch.object(
+        EmergencyManager, '_write_snapshot', autospec=True,
+        side_effect=EmergencyManager._write_snapshot
+    ) as write:
+        for size in (2.0, 3.0, 4.0):
+            emergency_manager.update_position_limits({'BTC-USD': size})
+        assert write.call_count == 0
+
+        await asyncio.sleep(EmergencyManager.FLUSH_INTERVAL * 2)
+
+    assert write.call_count == 1
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['position_limits']['BTC-USD'] == '4.0'
+
+@pytest.mark.asyncio
+async def test_save_in_loop_never_writes_on_loop_thread(emergency_manager):
+    """Test even the first save after a quiet window is written off the event loop."""
+    emergency_manager._last_flush -= EmergencyManager.FLUSH_INTERVAL * 10
+    loop_thread = threading.get_ident()
+    writers = []
+    real_write = EmergencyManager._write_snapshot
+    def record_thread(self, seq, payload):
+        writers.append(threading.get_ident())
+        return real_write(self, seq, payload)
+
+    with patch.object(EmergencyManager, '_write_snapshot', autospec=True, side_effect=record_thread):
+        emergency_manager.update_position_limits({'BTC-USD': 2.0})
+        assert writers == []
+
+        await asyncio.sleep(EmergencyManager.FLUSH_INTERVAL)
+
+    assert len(writers) == 1 and writers[0] != loop_thread
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['position_limits']['BTC-USD'] == '2.0'
+
+@pytest.mark.asyncio
+async def test_repeated_shutdown_skips_write(emergency_manager):
+    """Test saving state identical to the last snapshot does no I/O."""
+    await emergency_manager.emergency_shutdown()
+    with patch.object(EmergencyManager, '_write_snapshot') as write:
+        await emergency_manager.emergency_shutdown()
+        emergency_manager._save_state(force=True)
+    write.assert_not_called()
+
+def test_corrupted_write_keeps_previous_state(emergency_manager):
+    """Test a write whose read-back hash differs never replaces the state file."""
+    emergency_manager._save_state(force=True)
+    before = Path(emergency_manager.state_file).read_bytes()
+    real_write = os.write
+
+    emergency_manager.emergency_mode = True
+    corrupt = lambda fd, data: real_write(fd, bytes(data[:-2]) + b'!!')
+    with patch.object(os, 'write', side_effect=corrupt):
+        with pytest.raises(OSError, match="verification failed"):
+            emergency_manager._save_state(force=True)
+
+    assert Path(emergency_manager.state_file).read_bytes() == before
+    assert not Path(emergency_manager.state_file).with_suffix('.tmp').exists()
+
+def test_short_writes_are_completed(emergency_manager):
+    """Test a payload written in several partial os.write calls lands whole."""
+    real_write = os.write
+    half = lambda fd, data: real_write(fd, bytes(data[:max(1, len(data) // 2)]))
+
+    emergency_manager.emergency_mode = True
+    with patch.object(os, 'write', side_effect=half):
+        emergency_manager._save_state(force=True)
+
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['emergency_mode'] is True
+
+def test_save_without_loop_writes_immediately(emergency_manager):
+    """Test synchronous callers are not held back by the batching window."""
+    emergency_manager.update_position_limits({'BTC-USD': 1.0})
+    emergency_manager.update_position_limits({'BTC-USD': 2.0})  # inside FLUSH_INTERVAL
+
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['position_limits']['BTC-USD'] == '2.0'
+
+def test_pending_until_latest_snapshot_written(emergency_manager):
+    """Test an older snapshot's write does not drop the manager from the atexit set."""
+    emergency_manager.emergency_mode = True
+    _pending_managers.add(emergency_manager)
+    older = emergency_manager._snapshot()
+    newer = emergency_manager._snapshot()
+
+    emergency_manager._write_snapshot(*older)
+    assert emergency_manager in _pending_managers
+
+    emergency_manager._write_snapshot(*newer)
+    assert emergency_manager not in _pending_managers
+
+def test_deferred_flush_survives_closed_loop(emergency_manager):
+    """Test a flush pending on a finished loop does not block flushes on the next one."""
+    async def burst(start):
+        for size in (start, start + 1.0, start + 2.0):
+            emergency_manager.update_position_limits({'BTC-USD': size})
+
+    async def burst_and_wait():
+        await burst(4.0)
+        await asyncio.sleep(EmergencyManager.FLUSH_INTERVAL * 3)
+
+    asyncio.run(burst(1.0))  # the loop closes before its deferred flush fires
+    asyncio.run(burst_and_wait())
+
+    with open(emergency_manager.state_file) as f:
+        assert json.load(f)['position_limits']['BTC-USD'] == '6.0'
+
 @pytest.mark.asyncio
 async def test_restore_normal_operation(emergency_manager):
     """Test restoration of normal operation."""
@@ -128,6 +330,18 @@ def test_get_system_health(emergency_manager):
     assert 'position_limits' in health_status
     assert isinstance(health_status['position_limits']['BTC-USD'], float)
 
+def test_load_large_state_file(config_file, state_file):
+    """Test state files above the mmap threshold load and hash like small ones."""
+    limits = {f'PAIR{i}-USD': '1.5' for i in range(5000)}
+    raw = json.dumps({'emergency_mode': True, 'position_limits': limits}).encode()
+    Path(state_file).write_bytes(raw)
+
+    manager = EmergencyManager(config_file, state_file)
+
+    assert manager.emergency_mode is True
+    assert manager.position_limits['PAIR4999-USD'] == Decimal('1.5')
+    assert manager.get_system_health()['state_hash'] == hashlib.sha256(raw).hexdigest()
+
 def test_load_invalid_config(tmp_path):
     """Test handling of invalid configuration file."""
     invalid_config = tmp_path / "invalid_config.json"
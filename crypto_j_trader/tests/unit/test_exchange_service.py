@@ -188,4 +188,27 @@ def test_get_recent_trades_success(exchange_service):
     with patch.object(exchange_service.client, "get_trades", return_value=mock_trades):
         response = exchange_service.get_recent_trades("BTC-USD")
         assert response == mock_trades
-        exchange_service.client.get_trades.assert_called_once_with("BTC-USD")
\ No newline at end of file
+        exchange_service.client.get_trades.assert_called_once_with("BTC-USD")
+
+
+@pytest.mark.asyncio
+async def test_start_price_feed_normalizes_tickers(exchange_service):
+    """Test pushed ticker events are flattened into per-symbol messages, skipping malformed ones"""
+    async def fake_stream(self, product_ids, channel="ticker"):
+        yield {"channel": "ticker", "events": [{"type": "update", "tickers": [
+            {"product_id": "BTC-USD", "price": "50000.00"},
+            {"product_id": "SOL-USD"},
+            {"product_id": "ETH-USD", "price": "3000.00"}
+        ]}]}
+        yield {"channel": "subscriptions", "events": [{"subscriptions": {}}]}
+
+    with patch(
+        "crypto_j_trader.src.trading.exchange_service.AsyncCoinbaseAdvancedClient.stream",
+        fake_stream
+    ):
+        messages = [m async for m in exchange_service.start_price_feed(["BTC-USD", "ETH-USD"])]
+
+    assert messages == [
+        {"type": "ticker", "symbol": "BTC-USD", "price": "50000.00"},
+        {"type": "ticker", "symbol": "ETH-USD", "price": "3000.00"}
+    ]
@@ -0,0 +1,86 @@
+"""Unit tests for the main.py entry point helpers."""
+import sys
+import types
+import logging
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import Mock, patch
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+@pytest.fixture(scope="module")
+def main():
+    """Import main.py the way the entry point runs it, with crypto_j_trader/src on sys.path."""
+    sys.path.insert(0, str(SRC_DIR))
+    import main as module
+    yield module
+    sys.path.remove(str(SRC_DIR))
+
+@pytest.fixture
+def rest_client(main):
+    """Stand-in coinbase.rest.RESTClient class recording constructed clients."""
+    client_cls = Mock(return_value=Mock(get_accounts=Mock(return_value=Mock(accounts=[]))))
+    sdk = types.ModuleType("coinbase")
+    rest = types.ModuleType("coinbase.rest")
+    rest.RESTClient = client_cls
+    sdk.rest = rest
+    main._make_client.cache_clear()
+    with patch.dict(sys.modules, {"coinbase": sdk, "coinbase.rest": rest}):
+        yield client_cls
+    main._make_client.cache_clear()
+
+def test_make_client_shared_per_credentials(main, rest_client):
+    first = main._make_client("key", "secret", False)
+    second = main._make_client("key", "secret", False)
+
+    assert first is second
+    rest_client.assert_called_once_with(
+        api_key="key", api_secret="secret", timeout=main.CLIENT_TIMEOUT
+    )
+
+def test_setup_client_skips_probe_when_testing(main, rest_client, monkeypatch):
+    monkeypatch.setenv("COINBASE_API_KEY", "key")
+    monkeypatch.setenv("COINBASE_API_SECRET", "secret")
+    monkeypatch.setenv("TESTING", "true")
+
+    client = main.TradingBot._setup_client(None)
+
+    client.get_accounts.assert_not_called()
+
+def test_setup_client_probes_connection(main, rest_client, monkeypatch):
+    monkeypatch.setenv("COINBASE_API_KEY", "key")
+    monkeypatch.setenv("COINBASE_API_SECRET", "secret")
+    monkeypatch.delenv("TESTING", raising=False)
+
+    client = main.TradingBot._setup_client(None)
+
+    client.get_accounts.assert_called_once_with()
+
+def test_import_leaves_logging_unconfigured(main):
+    root = logging.getLogger()
+    assert not any(isinstance(h, QueueHandler) for h in root.handlers)
+
+def test_setup_logging_skips_configured_root(main, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    existing = logging.NullHandler()
+    with patch.object(logging.getLogger(), "handlers", [existing]):
+        main.setup_logging()
+        assert logging.getLogger().handlers == [existing]
+    assert not (tmp_path / "trading.log").exists()
+
+def test_setup_logging_routes_through_queue(main, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = logging.getLogger()
+    with patch.object(root, "handlers", []), patch.object(root, "level", root.level), \
+            patch.object(main.atexit, "register") as register:
+        main.setup_logging()
+        stop_listener = register.call_args[0][0]
+        try:
+            assert [type(h) for h in root.handlers] == [QueueHandler]
+            logging.getLogger("main").warning("queued")
+        finally:
+            stop_listener()  # drains the queue
+            for handler in stop_listener.__self__.handlers:
+                handler.close()
+    assert "queued" in (tmp_path / "trading.log").read_text()
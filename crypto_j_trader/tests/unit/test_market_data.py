@@ -139,6 +139,26 @@ class TestMarketDataService:  # Renamed test class
         # Verify the price update
         assert market_data_service.current_prices["BTC-USD"] == updated_price
 
+    @pytest.mark.asyncio
+    async def test_price_updates_from_decoded_feed_messages(self, mock_exchange_service):
+        """Test ticker dicts yielded by the exchange feed are applied without re-parsing"""
+        mock_exchange = mock_exchange_service
+        symbols = ["BTC-USD"]
+
+        async def mock_decoded_feed(symbols):
+            yield {"type": "ticker", "symbol": "BTC-USD", "price": "107.0"}
+
+        mock_exchange.start_price_feed = mock_decoded_feed
+
+        market_data_service = MarketDataService()
+        market_data_service.exchange_service = mock_exchange
+        market_data_service.current_prices = {"BTC-USD": 105.0}
+
+        await market_data_service.subscribe_price_updates(symbols)
+        await asyncio.sleep(0.5)
+
+        assert market_data_service.current_prices["BTC-USD"] == 107.0
+
     @pytest.mark.asyncio
     async def test_error_recovery(self, mock_exchange_service):
         """Test system recovery from data errors"""
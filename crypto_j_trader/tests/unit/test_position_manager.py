@@ -28,6 +28,8 @@ class TestPositionManager:
         assert position_manager.config == test_config
         assert isinstance(position_manager.positions, dict)
         assert isinstance(position_manager.volatility_windows, dict)
+        assert position_manager.risk_per_trade == 0.02
+        assert position_manager.size_precision == test_config['size_precision']
 
     def test_calculate_position_size(self, position_manager):
         """Test position size calculation."""
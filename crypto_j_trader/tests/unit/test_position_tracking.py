@@ -0,0 +1,43 @@
+"""Unit tests for fixed-point position tracking."""
+import pytest
+from decimal import Decimal
+from crypto_j_trader.src.trading.position_tracking import PositionTracker, to_fixed, to_decimal
+
+@pytest.fixture
+def tracker():
+    return PositionTracker()
+
+def test_fixed_point_round_trip():
+    assert to_fixed(Decimal('1.5')) == 150000000
+    assert to_decimal(to_fixed(Decimal('0.00000001'))) == Decimal('0.00000001')
+
+def test_buy_averages_entry_price(tracker):
+    tracker.update_position('BTC-USD', 'buy', Decimal('1'), Decimal('50000'))
+    tracker.update_position('BTC-USD', 'buy', Decimal('1'), Decimal('60000'))
+
+    position = tracker.get_position('BTC-USD')
+    assert position['quantity'] == Decimal('2')
+    assert position['entry_price'] == Decimal('55000')
+
+def test_partial_and_full_sell(tracker):
+    tracker.update_position('ETH-USD', 'buy', Decimal('2.5'), Decimal('3000'))
+    tracker.update_position('ETH-USD', 'sell', Decimal('1'), Decimal('3100'))
+    assert tracker.get_position('ETH-USD')['quantity'] == Decimal('1.5')
+
+    tracker.update_position('ETH-USD', 'sell', Decimal('1.5'), Decimal('3100'))
+    assert tracker.get_position('ETH-USD') is None
+
+def test_sell_errors(tracker):
+    with pytest.raises(ValueError, match="No position exists"):
+        tracker.update_position('BTC-USD', 'sell', Decimal('1'), Decimal('50000'))
+
+    tracker.update_position('BTC-USD', 'buy', Decimal('1'), Decimal('50000'))
+    with pytest.raises(ValueError, match="Insufficient position size"):
+        tracker.update_position('BTC-USD', 'sell', Decimal('2'), Decimal('50000'))
+
+def test_size_below_fixed_point_precision_rejected(tracker):
+    with pytest.raises(ValueError, match="positive multiple of 1e-8"):
+        tracker.update_position('BTC-USD', 'buy', Decimal('0.000000004'), Decimal('50000'))
+    with pytest.raises(ValueError, match="positive multiple of 1e-8"):
+        tracker.update_position('BTC-USD', 'buy', Decimal('1.000000001'), Decimal('50000'))
+    assert tracker.get_position('BTC-USD') is None
@@ -6,6 +6,9 @@ from websockets.exceptions import ConnectionClosed
 from datetime import datetime, timedelta
 from ...src.trading.websocket_handler import WebSocketHandler
 
+# Reconnect loops must fail the test instead of hanging the run
+pytestmark = pytest.mark.timeout(30)
+
 @pytest.fixture
 def health_monitor():
     """Create mock health monitor."""
@@ -39,6 +42,12 @@ def mock_websocket():
     websocket.close = AsyncMock()
     return websocket
 
+def test_last_message_time_round_trip(websocket_handler):
+    """Test the wall-clock view of the monotonic last-message stamp."""
+    stamp = datetime.utcnow() - timedelta(seconds=60)
+    websocket_handler.last_message_time = stamp
+    assert abs((websocket_handler.last_message_time - stamp).total_seconds()) < 1
+
 @pytest.mark.asyncio
 async def test_connection_monitor(websocket_handler, mock_websocket):
     """Test connection monitoring."""